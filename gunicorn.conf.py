@@ -0,0 +1,16 @@
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 5
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master so workers never share them"""
+    from wsgi import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -1,15 +1,36 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from pydantic import BaseModel, Field, validator
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Boolean, Float, or_, inspect, create_engine
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Boolean, Float, bindparam, column, inspect, event, func, insert, select, table, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, relationship, sessionmaker
+from sqlalchemy.orm import raiseload, relationship, selectinload, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 # Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """Enable WAL so readers are not blocked by the SQLite writer lock"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -18,7 +39,7 @@ Base = declarative_base()
 class PersonDB(Base):
     __tablename__ = "persons"
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100))
+    name = Column(String(100), index=True)
     age = Column(Integer)
     created_at = Column(DateTime, default=datetime.utcnow)
     addresses = relationship("AddressDB", back_populates="person")
@@ -29,8 +50,8 @@ class AddressDB(Base):
     __tablename__ = "addresses"
     id = Column(Integer, primary_key=True, index=True)
     street = Column(String(100))
-    city = Column(String(50))
-    person_id = Column(Integer, ForeignKey("persons.id"))
+    city = Column(String(50), index=True)
+    person_id = Column(Integer, ForeignKey("persons.id"), index=True)
     person = relationship("PersonDB", back_populates="addresses")
 
 
@@ -38,12 +59,44 @@ class PhoneDB(Base):
     __tablename__ = "phones"
     id = Column(Integer, primary_key=True, index=True)
     number = Column(String(20))
-    type = Column(String(10))  # 'home', 'work', etc.
-    person_id = Column(Integer, ForeignKey("persons.id"))
+    type = Column(String(10), index=True)  # 'home', 'work', etc.
+    person_id = Column(Integer, ForeignKey("persons.id"), index=True)
     person = relationship("PersonDB", back_populates="phones")
 
 
-Base.metadata.create_all(bind=engine)
+# Full-text indexes over each model's string columns, kept in sync by triggers
+FTS_TABLES = {
+    PersonDB: ("person_fts", ("name",)),
+    AddressDB: ("address_fts", ("street", "city")),
+    PhoneDB: ("phone_fts", ("number", "type")),
+}
+
+
+def fts_ddl(model: Type[Base]) -> List[str]:
+    """Return the statements creating a model's FTS5 table and its sync triggers"""
+    fts, columns = FTS_TABLES[model]
+    src = model.__tablename__
+    cols = ", ".join(columns)
+    new_vals = ", ".join(f"new.{c}" for c in columns)
+    old_vals = ", ".join(f"old.{c}" for c in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_vals});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{src}', content_rowid='id')",
+        f"CREATE TRIGGER {src}_ai AFTER INSERT ON {src} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {src}_ad AFTER DELETE ON {src} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {src}_au AFTER UPDATE ON {src} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+async def create_search_indexes(conn) -> None:
+    """Create missing FTS5 tables and index any rows that already exist"""
+    existing = set((await conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")).scalars())
+    for model, (fts, _) in FTS_TABLES.items():
+        if fts not in existing:
+            for statement in fts_ddl(model):
+                await conn.exec_driver_sql(statement)
 
 
 # --------------- Pydantic Models ---------------
@@ -107,86 +160,127 @@ class PersonResponse(PersonBase):
 
 
 # --------------- FastAPI Setup ---------------
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await create_search_indexes(conn)
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 # Dependency
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # --------------- Helper Functions ---------------
+# Loader options applied to list queries so relationships are fetched in bulk; any other
+# relationship access raises instead of silently issuing a query per row
+_QUERY_OPTIONS = {
+    PersonDB: (selectinload(PersonDB.addresses), selectinload(PersonDB.phones), raiseload("*")),
+}
+
+# Column and relationship metadata per model, reflected once instead of on every request
+_MODEL_META = {
+    model: {
+        "columns": {c.name: c for c in inspect(model).columns},
+        "rels": {
+            name: (rel.mapper.class_, {c.name: c for c in rel.mapper.columns})
+            for name, rel in inspect(model).relationships.items()
+        },
+    }
+    for model in (PersonDB, AddressDB, PhoneDB)
+}
+
+
+def filter_clause(key: str, col: Column, relationship: Optional[Any] = None) -> Tuple[Any, Any]:
+    """Build the filter for one query parameter around a bind parameter placeholder"""
+    param = bindparam(f"f_{key}")
+    clause = col.ilike(param, escape="\\") if isinstance(col.type, String) else col == param
+    if relationship is not None:
+        # EXISTS over the related rows, so matches on a collection don't duplicate parent rows
+        clause = relationship.any(clause) if relationship.property.uselist else relationship.has(clause)
+    return clause, col.type
+
+
+def filter_dispatch(model: Type[Base]) -> Dict[str, Tuple[Any, Any]]:
+    """Map every accepted query parameter, including 'rel__field' keys, to its filter"""
+    meta = _MODEL_META[model]
+    dispatch = {name: filter_clause(name, col) for name, col in meta["columns"].items()}
+    for rel_name, (_, rel_columns) in meta["rels"].items():
+        for field, col in rel_columns.items():
+            key = f"{rel_name}__{field}"
+            dispatch[key] = filter_clause(key, col, getattr(model, rel_name))
+    return dispatch
+
+
+_FILTER_DISPATCH = {model: filter_dispatch(model) for model in _MODEL_META}
+
+
+def like_pattern(value: str) -> str:
+    """Escape LIKE metacharacters in a filter value so only '*' acts as a wildcard"""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped.replace('*', '%')}%"
+
+
+def fts_query(search: str) -> str:
+    """Turn free text into an FTS5 query matching every term as a prefix"""
+    terms = search.replace('"', '""').split()
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+# Query string parsers keyed by column type; types without an entry stay strings
+_PARSERS = {
+    DateTime: datetime.fromisoformat,
+    Integer: int,
+    Float: float,
+    Boolean: lambda v: v.lower() in ("true", "1", "yes"),
+}
+
+
 def parse_value(value: str, col_type: Type[Column]) -> Union[str, int, float, bool, datetime]:
     """Convert query string values to appropriate Python types"""
-    try:
-        if isinstance(col_type, DateTime):
-            return datetime.fromisoformat(value)
-        elif isinstance(col_type, Integer):
-            return int(value)
-        elif isinstance(col_type, Float):
-            return float(value)
-        elif isinstance(col_type, Boolean):
-            return value.lower() in ["true", "1", "yes"]
+    parser = _PARSERS.get(type(col_type))
+    if parser is None:
         return value
+    try:
+        return parser(value)
     except (ValueError, TypeError):
         return value  # Return as string if conversion fails
 
 
-def build_filters(model: Type[Base], filters: Dict[str, Any]) -> List[Any]:
-    """Build SQLAlchemy filters from query parameters"""
+def build_filters(model: Type[Base], keys: Tuple[str, ...]) -> Tuple[List[Any], Dict[str, Any]]:
+    """Look up the prebuilt SQLAlchemy filters for the given query parameters"""
     query_filters = []
-    inspector = inspect(model)
-
-    for key, value in filters.items():
-        if "__" in key:
-            rel_name, rel_field = key.split("__", 1)
-            relationship = getattr(model, rel_name, None)
-            if relationship and hasattr(relationship.property.mapper.class_, rel_field):
-                rel_model = relationship.property.mapper.class_
-                rel_col = getattr(rel_model, rel_field)
-                parsed_value = parse_value(value, rel_col.type)
-                if isinstance(rel_col.type, String):
-                    query_filters.append(rel_col.ilike(f"%{parsed_value}%"))
-                else:
-                    query_filters.append(rel_col == parsed_value)
-        else:
-            column = inspector.columns.get(key)
-            if column:
-                col_type = column.type
-                parsed_value = parse_value(value, col_type)
-                if isinstance(col_type, String):
-                    query_filters.append(getattr(model, key).ilike(f"%{parsed_value}%"))
-                else:
-                    query_filters.append(getattr(model, key) == parsed_value)
-    return query_filters
-
-
-def build_query(
-    model: Type[Base],
-    db: Session,
-    filters: Dict[str, Any],
-    page: int = 1,
-    per_page: int = 10,
-    sort: Optional[str] = None,
-    search: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Build filtered and paginated query"""
-    query = db.query(model)
+    bind_types = {}
+    dispatch = _FILTER_DISPATCH[model]
 
-    # Apply search across all string fields
+    for key in keys:
+        entry = dispatch.get(key)
+        if entry is not None:
+            clause, bind_types[key] = entry
+            query_filters.append(clause)
+    return query_filters, bind_types
+
+
+@lru_cache(maxsize=256)
+def compile_query(model: Type[Base], keys: Tuple[str, ...], sort: Optional[str], search: bool):
+    """Build the select for a query shape once; values are supplied as bind parameters"""
+    query = select(model).options(*_QUERY_OPTIONS.get(model, ()))
+
+    # Apply search through the model's full-text index
     if search:
-        search_filters = []
-        for column in inspect(model).columns:
-            if isinstance(column.type, String):
-                search_filters.append(getattr(model, column.name).ilike(f"%{search}%"))
-        query = query.filter(or_(*search_filters))
+        fts, _ = FTS_TABLES[model]
+        matches = select(table(fts, column("rowid")).c.rowid).where(text(f"{fts} MATCH :search"))
+        query = query.filter(model.id.in_(matches))
 
     # Apply filters
-    query_filters = build_filters(model, filters)
+    query_filters, bind_types = build_filters(model, keys)
     if query_filters:
         query = query.filter(*query_filters)
 
@@ -200,185 +294,220 @@ def build_query(
                 sort_fields.append(getattr(model, field))
         query = query.order_by(*sort_fields)
 
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+
+    # Return the total matching rows alongside each row so one round trip serves both
+    query = query.add_columns(func.count().over().label("_total"))
+    return query, count_query, bind_types
+
+
+def serialize(item: Base) -> Dict[str, Any]:
+    """Convert a SQLAlchemy model to a plain dict, skipping Pydantic validation on reads"""
+    data = {name: getattr(item, name) for name in _MODEL_META[type(item)]["columns"]}
+    if isinstance(item, PersonDB):
+        data["addresses"] = [serialize(address) for address in item.addresses]
+        data["phones"] = [serialize(phone) for phone in item.phones]
+    return data
+
+
+async def build_query(
+    model: Type[Base],
+    db: AsyncSession,
+    filters: Dict[str, Any],
+    page: int = 1,
+    per_page: int = 10,
+    sort: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build filtered and paginated query"""
+    match = fts_query(search) if search else ""
+    query, count_query, bind_types = compile_query(model, tuple(sorted(filters)), sort, bool(match))
+
+    # Bind request values to the cached statement's placeholders
+    params = {}
+    if match:
+        params["search"] = match
+    for key, col_type in bind_types.items():
+        parsed_value = parse_value(filters[key], col_type)
+        params[f"f_{key}"] = like_pattern(parsed_value) if isinstance(col_type, String) else parsed_value
+
     # Pagination
-    total = query.count()
-    paginated = query.offset((page - 1) * per_page).limit(per_page).all()
-
-    # Convert SQLAlchemy models to Pydantic models
-    if model == PersonDB:
-        data = [PersonResponse.from_orm(item) for item in paginated]
-    elif model == AddressDB:
-        data = [AddressResponse.from_orm(item) for item in paginated]
-    elif model == PhoneDB:
-        data = [PhoneResponse.from_orm(item) for item in paginated]
+    result = await db.execute(query.offset((page - 1) * per_page).limit(per_page), params)
+    rows = result.all()
+    paginated = [item for item, _ in rows]
+    if rows:
+        total = rows[0]._total
+    elif page > 1:
+        total = await db.scalar(count_query, params)  # Past the last page; no row carries the total
     else:
-        data = paginated  # Fallback for unknown models (though not expected)
+        total = 0
 
+    data = [serialize(item) for item in paginated]
     return {"data": data, "total": total, "page": page, "per_page": per_page}
 
 
-def get_query_params(request: Request):
-    return dict(request.query_params)
+_SPECIAL_PARAMS = frozenset(("page", "per_page", "sort", "search"))
+
+
+def filter_params(request: Request) -> Dict[str, str]:
+    """Return the query parameters that are column filters"""
+    return {k: v for k, v in request.query_params.multi_items() if k not in _SPECIAL_PARAMS}
 
 
 # --------------- API Endpoints ---------------
-@app.get("/api/persons", response_model=Dict[str, Any])
-def get_persons(
-    db: Session = Depends(get_db),
+@app.get("/api/persons", response_model=None)
+async def get_persons(
+    db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
     sort: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    filters: Dict[str, Any] = Depends(get_query_params),
+    filters: Dict[str, str] = Depends(filter_params),
 ):
-    special_params = ["page", "per_page", "sort", "search"]
-    clean_filters = {k: v for k, v in filters.items() if k not in special_params}
-
-    result = build_query(
-        model=PersonDB, db=db, filters=clean_filters, page=page, per_page=per_page, sort=sort, search=search
+    result = await build_query(
+        model=PersonDB, db=db, filters=filters, page=page, per_page=per_page, sort=sort, search=search
     )
     return result
 
 
 @app.post("/api/persons", response_model=PersonResponse, status_code=status.HTTP_201_CREATED)
-def create_person(person: PersonCreate, db: Session = Depends(get_db)):
-    db_person = PersonDB(**person.dict())
-    db.add(db_person)
-    db.commit()
-    db.refresh(db_person)
+async def create_person(person: PersonCreate, db: AsyncSession = Depends(get_db)):
+    db_person = await db.scalar(insert(PersonDB).values(**person.dict()).returning(PersonDB))
+    await db.commit()
+
+    # A new person has no addresses or phones yet; mark them loaded rather than querying
+    set_committed_value(db_person, "addresses", [])
+    set_committed_value(db_person, "phones", [])
     return db_person
 
 
+@app.post("/api/persons/bulk", response_model=Dict[str, List[int]], status_code=status.HTTP_201_CREATED)
+async def create_persons(persons: List[PersonCreate], db: AsyncSession = Depends(get_db)):
+    if not persons:
+        return {"ids": []}
+    # insertmanyvalues batches this into multi-row INSERT ... RETURNING; keep ids in input order
+    stmt = insert(PersonDB).returning(PersonDB.id, sort_by_parameter_order=True)
+    result = await db.execute(stmt, [person.dict() for person in persons])
+    ids = result.scalars().all()
+    await db.commit()
+    return {"ids": ids}
+
+
 @app.put("/api/persons/{person_id}", response_model=PersonResponse)
-def update_person(person_id: int, person: PersonCreate, db: Session = Depends(get_db)):
-    db_person = db.query(PersonDB).filter(PersonDB.id == person_id).first()
+async def update_person(person_id: int, person: PersonCreate, db: AsyncSession = Depends(get_db)):
+    stmt = (
+        update(PersonDB)
+        .where(PersonDB.id == person_id)
+        .values(**person.dict())
+        .returning(PersonDB)
+        .options(*_QUERY_OPTIONS[PersonDB])
+    )
+    db_person = await db.scalar(stmt)
     if not db_person:
         raise HTTPException(status_code=404, detail="Person not found")
 
-    for key, value in person.dict().items():
-        setattr(db_person, key, value)
-
-    db.commit()
-    db.refresh(db_person)
+    await db.commit()
     return db_person
 
 
 @app.delete("/api/persons/{person_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_person(person_id: int, db: Session = Depends(get_db)):
-    db_person = db.query(PersonDB).filter(PersonDB.id == person_id).first()
+async def delete_person(person_id: int, db: AsyncSession = Depends(get_db)):
+    db_person = await db.get(PersonDB, person_id)
     if not db_person:
         raise HTTPException(status_code=404, detail="Person not found")
 
-    db.delete(db_person)
-    db.commit()
+    await db.delete(db_person)
+    await db.commit()
 
 
 # --------------- Address Endpoints ---------------
-@app.get("/api/addresses", response_model=Dict[str, Any])
-def get_addresses(
-    db: Session = Depends(get_db),
+@app.get("/api/addresses", response_model=None)
+async def get_addresses(
+    db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
     sort: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    filters: Dict[str, Any] = Depends(get_query_params),
+    filters: Dict[str, str] = Depends(filter_params),
 ):
-    special_params = ["page", "per_page", "sort", "search"]
-    clean_filters = {k: v for k, v in filters.items() if k not in special_params}
-
-    result = build_query(
-        model=AddressDB, db=db, filters=clean_filters, page=page, per_page=per_page, sort=sort, search=search
+    result = await build_query(
+        model=AddressDB, db=db, filters=filters, page=page, per_page=per_page, sort=sort, search=search
     )
     return result
 
 
 @app.post("/api/addresses", response_model=AddressResponse, status_code=status.HTTP_201_CREATED)
-def create_address(address: AddressCreate, db: Session = Depends(get_db)):
-    db_address = AddressDB(**address.dict())
-    db.add(db_address)
-    db.commit()
-    db.refresh(db_address)
+async def create_address(address: AddressCreate, db: AsyncSession = Depends(get_db)):
+    db_address = await db.scalar(insert(AddressDB).values(**address.dict()).returning(AddressDB))
+    await db.commit()
     return db_address
 
 
 @app.put("/api/addresses/{address_id}", response_model=AddressResponse)
-def update_address(address_id: int, address: AddressCreate, db: Session = Depends(get_db)):
-    db_address = db.query(AddressDB).filter(AddressDB.id == address_id).first()
+async def update_address(address_id: int, address: AddressCreate, db: AsyncSession = Depends(get_db)):
+    db_address = await db.scalar(update(AddressDB).where(AddressDB.id == address_id).values(**address.dict()).returning(AddressDB))
     if not db_address:
         raise HTTPException(status_code=404, detail="Address not found")
 
-    for key, value in address.dict().items():
-        setattr(db_address, key, value)
-
-    db.commit()
-    db.refresh(db_address)
+    await db.commit()
     return db_address
 
 
 @app.delete("/api/addresses/{address_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_address(address_id: int, db: Session = Depends(get_db)):
-    db_address = db.query(AddressDB).filter(AddressDB.id == address_id).first()
+async def delete_address(address_id: int, db: AsyncSession = Depends(get_db)):
+    db_address = await db.get(AddressDB, address_id)
     if not db_address:
         raise HTTPException(status_code=404, detail="Address not found")
 
-    db.delete(db_address)
-    db.commit()
+    await db.delete(db_address)
+    await db.commit()
 
 
 # --------------- Phone Endpoints ---------------
-@app.get("/api/phones", response_model=Dict[str, Any])
-def get_phones(
-    db: Session = Depends(get_db),
+@app.get("/api/phones", response_model=None)
+async def get_phones(
+    db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
     sort: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    filters: Dict[str, Any] = Depends(get_query_params),
+    filters: Dict[str, str] = Depends(filter_params),
 ):
-    special_params = ["page", "per_page", "sort", "search"]
-    clean_filters = {k: v for k, v in filters.items() if k not in special_params}
-
-    result = build_query(
-        model=PhoneDB, db=db, filters=clean_filters, page=page, per_page=per_page, sort=sort, search=search
+    result = await build_query(
+        model=PhoneDB, db=db, filters=filters, page=page, per_page=per_page, sort=sort, search=search
     )
     return result
 
 
 @app.post("/api/phones", response_model=PhoneResponse, status_code=status.HTTP_201_CREATED)
-def create_phone(phone: PhoneCreate, db: Session = Depends(get_db)):
-    db_phone = PhoneDB(**phone.dict())
-    db.add(db_phone)
-    db.commit()
-    db.refresh(db_phone)
+async def create_phone(phone: PhoneCreate, db: AsyncSession = Depends(get_db)):
+    db_phone = await db.scalar(insert(PhoneDB).values(**phone.dict()).returning(PhoneDB))
+    await db.commit()
     return db_phone
 
 
 @app.put("/api/phones/{phone_id}", response_model=PhoneResponse)
-def update_phone(phone_id: int, phone: PhoneCreate, db: Session = Depends(get_db)):
-    db_phone = db.query(PhoneDB).filter(PhoneDB.id == phone_id).first()
+async def update_phone(phone_id: int, phone: PhoneCreate, db: AsyncSession = Depends(get_db)):
+    db_phone = await db.scalar(update(PhoneDB).where(PhoneDB.id == phone_id).values(**phone.dict()).returning(PhoneDB))
     if not db_phone:
         raise HTTPException(status_code=404, detail="Phone not found")
 
-    for key, value in phone.dict().items():
-        setattr(db_phone, key, value)
-
-    db.commit()
-    db.refresh(db_phone)
+    await db.commit()
     return db_phone
 
 
 @app.delete("/api/phones/{phone_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_phone(phone_id: int, db: Session = Depends(get_db)):
-    db_phone = db.query(PhoneDB).filter(PhoneDB.id == phone_id).first()
+async def delete_phone(phone_id: int, db: AsyncSession = Depends(get_db)):
+    db_phone = await db.get(PhoneDB, phone_id)
     if not db_phone:
         raise HTTPException(status_code=404, detail="Phone not found")
 
-    db.delete(db_phone)
-    db.commit()
+    await db.delete(db_phone)
+    await db.commit()
 
 
 ########### To Run ##############################
-# pip install fastapi sqlalchemy uvicorn python-multipart pydantic[email]
+# pip install fastapi sqlalchemy aiosqlite uvicorn python-multipart pydantic[email]
 # uvicorn fastapi_app:app --reload
 # http://localhost:8000/docs
 # http://localhost:8000/redoc
@@ -1,17 +1,58 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, abort, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import inspect, or_
+from sqlalchemy import bindparam, delete, event, func, inspect, literal_column, or_, select, table, text, update
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache, wraps
+import hashlib
+import os
+import orjson
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize jsonify() output with orjson instead of the stdlib json module"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///example.db'
+app.json = ORJSONProvider(app)
+# Test hook: SQLITE_PATH points the app at a throwaway SQLite file. Only a path is accepted
+# because the engine options, pragmas, FTS5 index and triggers below are all SQLite-specific.
+app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.environ.get('SQLITE_PATH', 'example.db')}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db = SQLAlchemy(app)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_timeout': 30,
+    'pool_pre_ping': True,
+    'pool_recycle': 3600,
+    'query_cache_size': 1200,  # Bounded LRU of compiled SQL keyed by statement shape
+    'connect_args': {'check_same_thread': False},
+}
+# db.session is a scoped_session removed on app-context teardown; skip autoflush before list queries
+db = SQLAlchemy(app, session_options={'autoflush': False})
+
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """Enable WAL so readers are not blocked by the SQLite writer lock, fsync less per commit,
+    and give each connection a larger page cache, in-memory temp tables and memory-mapped reads"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.close()
+
+with app.app_context():
+    event.listen(db.engine, 'connect', set_sqlite_pragma)
 
 # ----------------- MODELS -----------------
 class Person(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100))
+    name = db.Column(db.String(100), index=True)
     age = db.Column(db.Integer)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     addresses = db.relationship('Address', backref='person', lazy=True)
@@ -20,152 +61,327 @@ class Person(db.Model):
 class Address(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     street = db.Column(db.String(100))
-    city = db.Column(db.String(50))
-    person_id = db.Column(db.Integer, db.ForeignKey('person.id'))
+    city = db.Column(db.String(50), index=True)
+    person_id = db.Column(db.Integer, db.ForeignKey('person.id'), index=True)
 
 class Phone(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     number = db.Column(db.String(20))
-    type = db.Column(db.String(10))  # 'home', 'work', etc.
-    person_id = db.Column(db.Integer, db.ForeignKey('person.id'))
+    type = db.Column(db.String(10), index=True)  # 'home', 'work', etc.
+    person_id = db.Column(db.Integer, db.ForeignKey('person.id'), index=True)
+
+class DataVersion(db.Model):
+    """Write counter per table, bumped by triggers so list ETags can be computed from one row per table"""
+    __tablename__ = 'data_version'
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
 
 # ----------------- HELPER FUNCTIONS -----------------
-def parse_value(value, col_type):
+def _parse_bool(value):
+    return value.lower() in ['true', '1', 'yes']
+
+def _parse_int(value):
+    """Parse signed ASCII integers with surrounding whitespace, as int() does, without raising"""
+    digits = value.strip()
+    if digits.startswith(('+', '-')):
+        digits = digits[1:]
+    if digits.isdigit() and digits.isascii():
+        return int(value)
+    return value
+
+# Query string parsers keyed by column type; columns of other types are compared as strings
+_PARSERS = {
+    db.DateTime: datetime.fromisoformat,
+    db.Integer: _parse_int,
+    db.Float: float,
+    db.Boolean: _parse_bool,
+}
+
+def parse_value(value, parser):
     """Convert query string values to appropriate Python types"""
-    try:
-        if isinstance(col_type, db.DateTime):
-            return datetime.fromisoformat(value)
-        elif isinstance(col_type, db.Integer):
-            return int(value)
-        elif isinstance(col_type, db.Float):
-            return float(value)
-        elif isinstance(col_type, db.Boolean):
-            return value.lower() in ['true', '1', 'yes']
+    if parser is None:
         return value
+    try:
+        return parser(value)
     except ValueError:
         return value  # Return as string if conversion fails
 
+# Column and relationship metadata per model, reflected once instead of on every request
+_MODEL_META = {
+    model: {
+        'columns': {c.name: c for c in inspect(model).columns},
+        'parsers': {c.name: _PARSERS.get(type(c.type)) for c in inspect(model).columns},
+        'string_cols': [c.name for c in inspect(model).columns if isinstance(c.type, db.String)],
+        'rel_map': {
+            name: (getattr(model, name), rel.uselist, {c.name: c for c in rel.mapper.columns})
+            for name, rel in inspect(model).relationships.items()
+        },
+    }
+    for model in (Person, Address, Phone)
+}
+
+# FTS5 tables mirroring a model's string columns; other models fall back to ILIKE search
+_FTS_TABLES = {
+    Person: 'person_fts',
+}
+
+def create_search_index():
+    """Create the FTS5 tables and their sync triggers if missing, indexing any existing rows"""
+    existing = set(db.session.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'")).scalars())
+    for model, fts in _FTS_TABLES.items():
+        if fts in existing:
+            continue
+        src = model.__tablename__
+        columns = _MODEL_META[model]['string_cols']
+        cols = ', '.join(columns)
+        insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {', '.join(f'new.{c}' for c in columns)});"
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {', '.join(f'old.{c}' for c in columns)});"
+        for statement in (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{src}', content_rowid='id')",
+            f"CREATE TRIGGER IF NOT EXISTS {src}_ai AFTER INSERT ON {src} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {src}_ad AFTER DELETE ON {src} BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {src}_au AFTER UPDATE ON {src} BEGIN {delete_old} {insert_new} END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ):
+            db.session.execute(text(statement))
+    db.session.commit()
+
+def create_version_triggers():
+    """Seed the data_version rows and the triggers that bump them on every insert, update and delete"""
+    for model in (Person, Address, Phone):
+        src = model.__tablename__
+        db.session.execute(text(f"INSERT OR IGNORE INTO data_version (name, version) VALUES ('{src}', 0)"))
+        bump = f"UPDATE data_version SET version = version + 1 WHERE name = '{src}';"
+        for suffix, event_name in (('ai', 'INSERT'), ('au', 'UPDATE'), ('ad', 'DELETE')):
+            db.session.execute(text(f"CREATE TRIGGER IF NOT EXISTS {src}_version_{suffix} AFTER {event_name} ON {src} BEGIN {bump} END"))
+    db.session.commit()
+
+# Create the schema, search index and version triggers on import so every entry point
+# (flask run, wsgi.py, tests) serves ?search= and fresh ETags; each step is idempotent
+with app.app_context():
+    db.create_all()
+    create_search_index()
+    create_version_triggers()
+
+def fts_query(search):
+    """Turn free text into an FTS5 query matching every term as a prefix"""
+    return ' '.join(f'"{term}"*' for term in search.replace('"', '""').split())
+
+# Search expression per model, built once; the term is bound per request
+_SEARCH_EXPRS = {
+    model: (
+        model.id.in_(select(literal_column('rowid')).select_from(table(_FTS_TABLES[model])).where(text(f"{_FTS_TABLES[model]} MATCH :search")))
+        if model in _FTS_TABLES
+        else or_(*[getattr(model, name).ilike(bindparam('search'), escape='\\') for name in meta['string_cols']])
+    )
+    for model, meta in _MODEL_META.items()
+}
+
+def escape_like(value):
+    """Escape LIKE metacharacters so user input only matches literally"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def string_filter(column, value):
+    """Match a string column exactly unless the value contains '*' wildcards"""
+    if '*' in value:
+        return column.ilike(escape_like(value).replace('*', '%'), escape='\\')
+    return column == value
+
 def build_filters(model, filters):
-    """Build SQLAlchemy filters from query parameters"""
+    """Build SQLAlchemy filters from (key, value) query parameter pairs"""
     query_filters = []
-    inspector = inspect(model)
+    meta = _MODEL_META[model]
     
-    for key, value in filters.items():
+    for key, value in filters:
         if '__' in key:
-            # Handle relationships (e.g., 'address__city')
+            # Handle relationships (e.g., 'addresses__city')
             rel_name, rel_field = key.split('__', 1)
-            relationship = getattr(model, rel_name, None)
-            if relationship and hasattr(relationship.property.mapper.class_, rel_field):
-                rel_model = relationship.property.mapper.class_
-                rel_col = getattr(rel_model, rel_field)
-                query_filters.append(rel_col.ilike(f'%{value}%') if isinstance(rel_col.type, db.String) else rel_col == value)
+            rel = meta['rel_map'].get(rel_name)
+            rel_col = rel[2].get(rel_field) if rel else None
+            if rel_col is not None:
+                rel_attr, uselist, _ = rel
+                condition = string_filter(rel_col, value) if isinstance(rel_col.type, db.String) else rel_col == value
+                # Correlated EXISTS keeps one row per parent and leaves the count query valid
+                query_filters.append(rel_attr.any(condition) if uselist else rel_attr.has(condition))
         else:
             # Handle direct attributes
-            column = inspector.columns.get(key)
-            if column:
-                col_type = column.type
-                parsed_value = parse_value(value, col_type)
-                if isinstance(col_type, db.String):
-                    query_filters.append(getattr(model, key).ilike(f'%{parsed_value}%'))
+            column = meta['columns'].get(key)
+            if column is not None:
+                parsed_value = parse_value(value, meta['parsers'][key])
+                if isinstance(column.type, db.String):
+                    query_filters.append(string_filter(column, parsed_value))
                 else:
-                    query_filters.append(getattr(model, key) == parsed_value)
+                    query_filters.append(column == parsed_value)
     return query_filters
 
-def build_query(model):
-    """Build filtered and paginated query"""
-    # Get all query parameters
-    filters = request.args.to_dict()
-    
-    # Remove special parameters
-    page = int(filters.pop('page', 1))
-    per_page = int(filters.pop('per_page', 10))
-    sort = filters.pop('sort', None)
-    search = filters.pop('search', None)
-    
-    # Base query
-    query = model.query
+@lru_cache(maxsize=256)
+def parse_sort(model, sort):
+    """Map a ?sort= string to order_by clauses, rejecting unknown columns with 400"""
+    columns = _MODEL_META[model]['columns']
+    sort_fields = []
+    for field in sort.split(','):
+        column = columns.get(field.lstrip('-'))
+        if column is None:
+            abort(400, description=f'Unknown sort field: {field}')
+        sort_fields.append(column.desc() if field.startswith('-') else column)
+    return tuple(sort_fields)
+
+# Query string parameters that control paging, sorting and search rather than filtering
+_RESERVED = frozenset(('page', 'per_page', 'sort', 'search', 'count', 'after'))
+
+def build_core_select(model, columns, conditions=()):
+    """Build a Core SELECT of the given table columns so rows come back as mappings, not ORM instances"""
+    table_columns = model.__table__.c
+    return select(*[table_columns[name] for name in columns]).filter(*conditions)
+
+def build_query(model, only_cols):
+    """Build filtered and paginated query selecting only the columns the caller serializes"""
+    # Read special parameters straight from the query string
+    args = request.args
+    page = int(args.get('page', 1))
+    per_page = int(args.get('per_page', 10))
+    sort = args.get('sort')
+    search = args.get('search')
+    after = args.get('after')
+    count = args.get('count', 'true').lower() != 'false'
     
     # Apply search across all string fields
-    if search:
-        search_filters = []
-        for column in inspect(model).columns:
-            if isinstance(column.type, db.String):
-                search_filters.append(getattr(model, column.name).ilike(f'%{search}%'))
-        query = query.filter(or_(*search_filters))
+    conditions = []
+    params = {}
+    term = (fts_query(search) if model in _FTS_TABLES else f'%{escape_like(search)}%') if search else ''
+    if term:
+        conditions.append(_SEARCH_EXPRS[model])
+        params['search'] = term
     
-    # Apply filters
-    query_filters = build_filters(model, filters)
-    if query_filters:
-        query = query.filter(*query_filters)
+    # Apply filters from the remaining parameters without copying them into a dict
+    conditions.extend(build_filters(model, ((k, v) for k, v in args.items() if k not in _RESERVED)))
+    
+    # Base query
+    query = build_core_select(model, only_cols, conditions)
     
     # Apply sorting
     if sort:
-        sort_fields = []
-        for field in sort.split(','):
-            if field.startswith('-'):
-                sort_fields.append(getattr(model, field[1:]).desc())
-            else:
-                sort_fields.append(getattr(model, field))
-        query = query.order_by(*sort_fields)
+        query = query.order_by(*parse_sort(model, sort))
+    
+    # Keyset pagination: seek past the cursor on the primary key instead of OFFSET + COUNT
+    per_page = max(per_page, 1)
+    if after is not None:
+        cursor = parse_value(after, _parse_int)
+        if not isinstance(cursor, int):
+            abort(400, description=f'Invalid after cursor: {after}')
+        query = query.order_by(None).order_by(model.id).filter(model.id > cursor)
+        data = [dict(row) for row in db.session.execute(query.limit(per_page), params).mappings()]
+        next_cursor = data[-1]['id'] if len(data) == per_page else None
+        return {'data': data, 'next_cursor': next_cursor, 'per_page': per_page}
     
     # Pagination
-    paginated_query = query.paginate(page=page, per_page=per_page, error_out=False)
+    page = max(page, 1)
+    query = query.offset((page - 1) * per_page)
+    if not count:
+        # Fetch one extra row to tell whether another page exists without counting
+        data = [dict(row) for row in db.session.execute(query.limit(per_page + 1), params).mappings()]
+        return {'data': data[:per_page], 'has_more': len(data) > per_page, 'page': page, 'per_page': per_page}
+    
+    # Count against the table with the same conditions instead of wrapping the query in a subquery
+    total = db.session.execute(select(func.count()).select_from(model).filter(*conditions), params).scalar()
+    rows = db.session.execute(query.limit(per_page), params).mappings()
     
-    return paginated_query
+    # Rows are converted lazily so stream_json can serialize them as the cursor yields them
+    return {'data': (dict(row) for row in rows), 'total': total, 'page': page, 'per_page': per_page}
+
+def group_by_person(model, columns, person_ids):
+    """Fetch child rows for a page of persons in one query, grouped by person_id"""
+    grouped = defaultdict(list)
+    if person_ids:
+        query = build_core_select(model, ('person_id', *columns), [model.person_id.in_(person_ids)])
+        for row in db.session.execute(query).mappings():
+            grouped[row['person_id']].append({name: row[name] for name in columns})
+    return grouped
+
+def stream_json(rows, meta):
+    """Serialize {'data': rows, **meta} one row at a time instead of as a single string"""
+    yield b'{"data":['
+    sep = b''
+    for row in rows:
+        yield sep + orjson.dumps(row)
+        sep = b','
+    yield b'],' + orjson.dumps(meta)[1:]
+
+# Version probe per list endpoint: the data_version counters of the model and of every table its
+# relationship filters or nested output can read, fetched by primary key
+_VERSION_PROBES = {
+    model: select(DataVersion.version).where(DataVersion.name.in_(sorted({
+        model.__tablename__,
+        *(rel_attr.property.mapper.class_.__tablename__ for rel_attr, _, _ in meta['rel_map'].values()),
+    }))).order_by(DataVersion.name)
+    for model, meta in _MODEL_META.items()
+}
+
+def etag_cached(model):
+    """Answer 304 when If-None-Match matches the data version and query string; tag responses otherwise"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper():
+            versions = db.session.execute(_VERSION_PROBES[model]).scalars().all()
+            if not versions:
+                return view()  # Version tracking not set up; never risk a stale 304
+            key = orjson.dumps([request.path, sorted(request.args.items(multi=True)), versions])
+            etag = hashlib.blake2b(key, digest_size=16).hexdigest()
+            if request.if_none_match.contains_weak(etag):
+                response = app.response_class(status=304)
+            else:
+                response = view()
+            response.set_etag(etag, weak=True)
+            return response
+        return wrapper
+    return decorator
+
+@app.errorhandler(400)
+def bad_request(error):
+    """Report rejected query parameters in the same JSON shape as the endpoints' own errors"""
+    return jsonify({'error': error.description}), 400
 
 # ----------------- API ENDPOINTS -----------------
 @app.route('/api/persons', methods=['GET'])
+@etag_cached(Person)
 def get_persons():
-    paginated_persons = build_query(Person)
-    return jsonify({
-        'data': [{
-            'id': p.id,
-            'name': p.name,
-            'age': p.age,
-            'addresses': [{'street': a.street, 'city': a.city} for a in p.addresses],
-            'phones': [{'number': ph.number, 'type': ph.type} for ph in p.phones]
-        } for p in paginated_persons.items],
-        'total': paginated_persons.total,
-        'page': paginated_persons.page,
-        'per_page': paginated_persons.per_page
-    })
+    result = build_query(Person, ('id', 'name', 'age'))
+    persons = list(result.pop('data'))
+    person_ids = [p['id'] for p in persons]
+    addresses = group_by_person(Address, ('street', 'city'), person_ids)
+    phones = group_by_person(Phone, ('number', 'type'), person_ids)
+
+    def rows():
+        for p in persons:
+            p['addresses'] = addresses[p['id']]
+            p['phones'] = phones[p['id']]
+            yield p
+
+    return app.response_class(stream_with_context(stream_json(rows(), result)), mimetype='application/json')
 
 @app.route('/api/addresses', methods=['GET'])
+@etag_cached(Address)
 def get_addresses():
-    paginated_addresses = build_query(Address)
-    return jsonify({
-        'data': [{
-            'id': a.id,
-            'street': a.street,
-            'city': a.city,
-            'person_id': a.person_id
-        } for a in paginated_addresses.items],
-        'total': paginated_addresses.total,
-        'page': paginated_addresses.page,
-        'per_page': paginated_addresses.per_page
-    })
+    result = build_query(Address, ('id', 'street', 'city', 'person_id'))
+    return app.response_class(stream_with_context(stream_json(result.pop('data'), result)), mimetype='application/json')
 
 @app.route('/api/phones', methods=['GET'])
+@etag_cached(Phone)
 def get_phones():
-    paginated_phones = build_query(Phone)
-    return jsonify({
-        'data': [{
-            'id': ph.id,
-            'number': ph.number,
-            'type': ph.type,
-            'person_id': ph.person_id
-        } for ph in paginated_phones.items],
-        'total': paginated_phones.total,
-        'page': paginated_phones.page,
-        'per_page': paginated_phones.per_page
-    })
+    result = build_query(Phone, ('id', 'number', 'type', 'person_id'))
+    return app.response_class(stream_with_context(stream_json(result.pop('data'), result)), mimetype='application/json')
 
 # ----------------- HELPER FUNCTIONS -----------------
+# Required fields per model for create requests
+_REQ_PERSON = frozenset(('name', 'age'))
+_REQ_ADDRESS = frozenset(('street', 'city', 'person_id'))
+_REQ_PHONE = frozenset(('number', 'type', 'person_id'))
+
 def validate_required_fields(data, required_fields):
     """Validate required fields in request data"""
-    missing = [field for field in required_fields if field not in data]
+    missing = required_fields.difference(data)
     if missing:
-        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
 
 def handle_db_operations():
     """Handle database commit with error handling"""
@@ -175,12 +391,52 @@ def handle_db_operations():
         db.session.rollback()
         raise e
 
+def bulk_create(model, fields):
+    """Insert a JSON array of records in one transaction, bypassing per-object unit of work"""
+    data = request.get_json()
+    if not isinstance(data, list):
+        raise ValueError('Expected a JSON array of records')
+    for record in data:
+        if not isinstance(record, dict):
+            raise ValueError('Each record must be a JSON object')
+        validate_required_fields(record, fields)
+    
+    db.session.bulk_insert_mappings(model, [{field: record[field] for field in fields} for record in data])
+    handle_db_operations()
+    return jsonify({'created': len(data)}), 201
+
+def update_row(model, id, fields):
+    """Apply the allowed fields from the JSON body with a single UPDATE ... RETURNING"""
+    data = request.get_json()
+    tbl = model.__table__
+    values = {field: data[field] for field in fields if field in data}
+    columns = [tbl.c[name] for name in ('id', *fields)]
+    if values:
+        query = update(tbl).where(tbl.c.id == id).values(**values).returning(*columns)
+    else:
+        query = select(*columns).where(tbl.c.id == id)
+    row = db.session.execute(query).mappings().first()
+    if row is None:
+        return jsonify({'error': f'{model.__name__} not found'}), 404
+    handle_db_operations()
+    return jsonify(dict(row))
+
+def delete_row(model, id):
+    """Delete by primary key with a single DELETE, using rowcount to detect a missing row"""
+    tbl = model.__table__
+    result = db.session.execute(delete(tbl).where(tbl.c.id == id))
+    if result.rowcount == 0:
+        db.session.rollback()  # Undo any statements the caller ran ahead of the delete
+        return jsonify({'error': f'{model.__name__} not found'}), 404
+    handle_db_operations()
+    return jsonify({'message': f'{model.__name__} deleted successfully'}), 200
+
 # ----------------- PERSON ENDPOINTS -----------------
 @app.route('/api/persons', methods=['POST'])
 def create_person():
     try:
         data = request.get_json()
-        validate_required_fields(data, ['name', 'age'])
+        validate_required_fields(data, _REQ_PERSON)
         
         new_person = Person(
             name=data['name'],
@@ -203,31 +459,26 @@ def create_person():
 @app.route('/api/persons/<int:id>', methods=['PUT', 'PATCH'])
 def update_person(id):
     try:
-        person = Person.query.get_or_404(id)
-        data = request.get_json()
-        
-        if 'name' in data:
-            person.name = data['name']
-        if 'age' in data:
-            person.age = data['age']
-            
-        handle_db_operations()
-        return jsonify({
-            'id': person.id,
-            'name': person.name,
-            'age': person.age
-        })
-        
+        return update_row(Person, id, ['name', 'age'])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/persons/<int:id>', methods=['DELETE'])
 def delete_person(id):
     try:
-        person = Person.query.get_or_404(id)
-        db.session.delete(person)
-        handle_db_operations()
-        return jsonify({'message': 'Person deleted successfully'}), 200
+        # Detach children as the ORM relationship did on delete, without loading them
+        for child in (Address, Phone):
+            db.session.execute(update(child.__table__).where(child.__table__.c.person_id == id).values(person_id=None))
+        return delete_row(Person, id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/persons/bulk', methods=['POST'])
+def create_persons():
+    try:
+        return bulk_create(Person, _REQ_PERSON)
+    except ValueError as ve:
+        return jsonify({'error': str(ve)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -236,7 +487,7 @@ def delete_person(id):
 def create_address():
     try:
         data = request.get_json()
-        validate_required_fields(data, ['street', 'city', 'person_id'])
+        validate_required_fields(data, _REQ_ADDRESS)
         
         new_address = Address(
             street=data['street'],
@@ -261,34 +512,23 @@ def create_address():
 @app.route('/api/addresses/<int:id>', methods=['PUT', 'PATCH'])
 def update_address(id):
     try:
-        address = Address.query.get_or_404(id)
-        data = request.get_json()
-        
-        if 'street' in data:
-            address.street = data['street']
-        if 'city' in data:
-            address.city = data['city']
-        if 'person_id' in data:
-            address.person_id = data['person_id']
-            
-        handle_db_operations()
-        return jsonify({
-            'id': address.id,
-            'street': address.street,
-            'city': address.city,
-            'person_id': address.person_id
-        })
-        
+        return update_row(Address, id, ['street', 'city', 'person_id'])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/addresses/<int:id>', methods=['DELETE'])
 def delete_address(id):
     try:
-        address = Address.query.get_or_404(id)
-        db.session.delete(address)
-        handle_db_operations()
-        return jsonify({'message': 'Address deleted successfully'}), 200
+        return delete_row(Address, id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/addresses/bulk', methods=['POST'])
+def create_addresses():
+    try:
+        return bulk_create(Address, _REQ_ADDRESS)
+    except ValueError as ve:
+        return jsonify({'error': str(ve)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -297,7 +537,7 @@ def delete_address(id):
 def create_phone():
     try:
         data = request.get_json()
-        validate_required_fields(data, ['number', 'type', 'person_id'])
+        validate_required_fields(data, _REQ_PHONE)
         
         new_phone = Phone(
             number=data['number'],
@@ -322,38 +562,30 @@ def create_phone():
 @app.route('/api/phones/<int:id>', methods=['PUT', 'PATCH'])
 def update_phone(id):
     try:
-        phone = Phone.query.get_or_404(id)
-        data = request.get_json()
-        
-        if 'number' in data:
-            phone.number = data['number']
-        if 'type' in data:
-            phone.type = data['type']
-        if 'person_id' in data:
-            phone.person_id = data['person_id']
-            
-        handle_db_operations()
-        return jsonify({
-            'id': phone.id,
-            'number': phone.number,
-            'type': phone.type,
-            'person_id': phone.person_id
-        })
-        
+        return update_row(Phone, id, ['number', 'type', 'person_id'])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/phones/<int:id>', methods=['DELETE'])
 def delete_phone(id):
     try:
-        phone = Phone.query.get_or_404(id)
-        db.session.delete(phone)
-        handle_db_operations()
-        return jsonify({'message': 'Phone deleted successfully'}), 200
+        return delete_row(Phone, id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/phones/bulk', methods=['POST'])
+def create_phones():
+    try:
+        return bulk_create(Phone, _REQ_PHONE)
+    except ValueError as ve:
+        return jsonify({'error': str(ve)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
-    db.create_all()
-    app.run(debug=True)
+    # Development only; serve production traffic with gunicorn (see below)
+    app.run()
 
+########### To Run ##############################
+# pip install flask flask-sqlalchemy orjson gunicorn gevent
+# gunicorn -c gunicorn.conf.py wsgi:app
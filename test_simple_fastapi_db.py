@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from fastapi.testclient import TestClient
+
+# The engine URL is relative (./test.db) and resolved when the engine is created, so import
+# the app from a throwaway working directory
+_cwd = os.getcwd()
+os.chdir(tempfile.mkdtemp())
+try:
+    from simple_fastapi_db import app
+finally:
+    os.chdir(_cwd)
+
+
+class FastAPITestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._client_context = TestClient(app)
+        cls.client = cls._client_context.__enter__()
+        cls.people = {}
+        for name, age, city, number, phone_type in (
+            ('Alice', 30, 'Paris', '5550', 'home'),
+            ('Bob', 40, 'Rome', '5551', 'work'),
+            ('Carol', 50, 'Paris', '5552', 'mobile'),
+        ):
+            person_id = cls.client.post('/api/persons', json={'name': name, 'age': age}).json()['id']
+            cls.client.post('/api/addresses', json={'street': f'{age} Main', 'city': city, 'person_id': person_id})
+            cls.client.post('/api/phones', json={'number': number, 'type': phone_type, 'person_id': person_id})
+            cls.people[name] = person_id
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._client_context.__exit__(None, None, None)
+
+    def test_relationship_filters(self):
+        response = self.client.get('/api/persons?addresses__city=Paris&sort=id')
+        self.assertEqual([p['id'] for p in response.json()['data']], [self.people['Alice'], self.people['Carol']])
+        self.assertEqual(response.json()['total'], 2)
+        response = self.client.get('/api/phones?person__name=Bob')
+        self.assertEqual([p['number'] for p in response.json()['data']], ['5551'])
+
+
+    def test_search_matches_prefix(self):
+        response = self.client.get('/api/persons?search=ali')
+        self.assertEqual([p['name'] for p in response.json()['data']], ['Alice'])
+        response = self.client.get('/api/addresses?search=par&sort=id')
+        self.assertEqual([a['city'] for a in response.json()['data']], ['Paris', 'Paris'])
+        self.assertEqual(self.client.get('/api/persons?search=lice').json()['data'], [])
+
+    def test_total_past_last_page(self):
+        response = self.client.get('/api/addresses?city=Paris&per_page=1&page=2')
+        self.assertEqual(len(response.json()['data']), 1)
+        self.assertEqual(response.json()['total'], 2)
+        response = self.client.get('/api/addresses?city=Paris&per_page=1&page=5')
+        self.assertEqual(response.json()['data'], [])
+        self.assertEqual(response.json()['total'], 2)
+
+    def test_update_person_returns_relationships(self):
+        person_id = self.people['Bob']
+        response = self.client.put(f'/api/persons/{person_id}', json={'name': 'Bob', 'age': 41})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['age'], 41)
+        self.assertEqual([a['city'] for a in body['addresses']], ['Rome'])
+        self.assertEqual([p['number'] for p in body['phones']], ['5551'])
+        self.assertEqual(self.client.put('/api/persons/999', json={'name': 'X', 'age': 1}).status_code, 404)
+
+    def test_bulk_create_returns_ids_in_input_order(self):
+        names = [f'Bulk{i:03d}' for i in range(50)]
+        response = self.client.post('/api/persons/bulk', json=[{'name': name, 'age': 20} for name in names])
+        self.assertEqual(response.status_code, 201)
+        ids = response.json()['ids']
+        self.assertEqual(len(ids), len(names))
+        stored = {p['id']: p['name'] for p in self.client.get('/api/persons?name=Bulk&per_page=100').json()['data']}
+        self.assertEqual([stored[person_id] for person_id in ids], names)
+        self.assertEqual(self.client.post('/api/persons/bulk', json=[]).json(), {'ids': []})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ['SQLITE_PATH'] = DB_PATH
+
+from simple_flask_db import Address, Person, Phone, app, db
+
+
+class FlaskApiTestCase(unittest.TestCase):
+    def setUp(self):
+        # Schema, search index and version triggers come from the import of simple_flask_db
+        with app.app_context():
+            for model in (Phone, Address, Person):
+                db.session.execute(model.__table__.delete())
+            db.session.commit()
+        self.client = app.test_client()
+        person_id = self.client.post('/api/persons', json={'name': 'Alice', 'age': 30}).json['id']
+        self.client.post('/api/addresses', json={'street': '1 Main', 'city': 'Paris', 'person_id': person_id})
+        self.client.post('/api/phones', json={'number': '5550', 'type': 'home', 'person_id': person_id})
+        self.person_id = person_id
+
+    def test_after_cursor(self):
+        response = self.client.get('/api/persons?after=0')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p['id'] for p in response.json['data']], [self.person_id])
+
+    def test_after_cursor_rejects_non_integer(self):
+        response = self.client.get('/api/addresses?after=abc')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json)
+
+    def test_search_matches_name_prefix(self):
+        response = self.client.get('/api/persons?search=ali')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p['id'] for p in response.json['data']], [self.person_id])
+        response = self.client.get('/api/persons?search=bob')
+        self.assertEqual(response.json['data'], [])
+
+    def test_integer_filter_accepts_sign_and_whitespace(self):
+        for age in ('30', '%2B30', '%2030'):
+            response = self.client.get(f'/api/persons?age={age}')
+            self.assertEqual([p['id'] for p in response.json['data']], [self.person_id])
+        response = self.client.get('/api/persons?after=%2B0')
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_not_modified(self):
+        etag = self.client.get('/api/phones').headers['ETag']
+        response = self.client.get('/api/phones', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_after_write(self):
+        etag = self.client.get('/api/phones').headers['ETag']
+        self.client.post('/api/phones', json={'number': '5551', 'type': 'work', 'person_id': self.person_id})
+        response = self.client.get('/api/phones', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), 2)
+
+    def test_etag_changes_when_related_row_is_updated(self):
+        response = self.client.get('/api/addresses?person__name=Alice')
+        self.assertEqual(len(response.json['data']), 1)
+        etag = response.headers['ETag']
+        self.client.put(f'/api/persons/{self.person_id}', json={'name': 'Zed'})
+        response = self.client.get('/api/addresses?person__name=Alice', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['data'], [])
+
+    def test_delete_missing_person_keeps_children(self):
+        # SQLite does not enforce the foreign key, so children can reference an absent person
+        self.client.post('/api/addresses', json={'street': '2 Side', 'city': 'Rome', 'person_id': 999})
+        response = self.client.delete('/api/persons/999')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/api/addresses?city=Rome')
+        self.assertEqual(response.json['data'][0]['person_id'], 999)
+
+
+    def test_bulk_create(self):
+        response = self.client.post('/api/persons/bulk', json=[{'name': 'Bob', 'age': 40}, {'name': 'Carol', 'age': 50}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json, {'created': 2})
+        names = [p['name'] for p in self.client.get('/api/persons?sort=id').json['data']]
+        self.assertEqual(names, ['Alice', 'Bob', 'Carol'])
+
+    def test_bulk_create_rejects_missing_field(self):
+        response = self.client.post('/api/phones/bulk', json=[{'number': '5551', 'type': 'work', 'person_id': self.person_id}, {'number': '5552'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json['error'], 'Missing required fields: person_id, type')
+        self.assertEqual(self.client.get('/api/phones').json['total'], 1)
+
+    def test_bulk_create_rejects_non_list_body(self):
+        response = self.client.post('/api/addresses/bulk', json={'street': '2 Side', 'city': 'Rome', 'person_id': self.person_id})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json)
+
+    def test_count_false_reports_has_more(self):
+        self.client.post('/api/persons', json={'name': 'Bob', 'age': 40})
+        response = self.client.get('/api/persons?count=false&per_page=1')
+        self.assertEqual(len(response.json['data']), 1)
+        self.assertIs(response.json['has_more'], True)
+        self.assertNotIn('total', response.json)
+        response = self.client.get('/api/persons?count=false&per_page=1&page=2')
+        self.assertIs(response.json['has_more'], False)
+
+    def test_count_uses_filters(self):
+        self.client.post('/api/persons', json={'name': 'Bob', 'age': 40})
+        self.assertEqual(self.client.get('/api/persons').json['total'], 2)
+        self.assertEqual(self.client.get('/api/persons?age=40').json['total'], 1)
+
+    def test_sort(self):
+        self.client.post('/api/persons', json={'name': 'Bob', 'age': 40})
+        names = [p['name'] for p in self.client.get('/api/persons?sort=-age').json['data']]
+        self.assertEqual(names, ['Bob', 'Alice'])
+
+    def test_sort_rejects_unknown_field(self):
+        response = self.client.get('/api/persons?sort=-bogus')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json, {'error': 'Unknown sort field: -bogus'})
+
+    def test_string_filters(self):
+        self.client.post('/api/persons', json={'name': 'Al_50%', 'age': 40})
+        def names(query):
+            return sorted(p['name'] for p in self.client.get(f'/api/persons?{query}').json['data'])
+        self.assertEqual(names('name=Alice'), ['Alice'])
+        self.assertEqual(names('name=Ali'), [])  # Plain values match exactly
+        self.assertEqual(names('name=al*'), ['Al_50%', 'Alice'])
+        self.assertEqual(names('name=_'), [])
+        self.assertEqual(names('name=*_*'), ['Al_50%'])  # '_' and '%' only match themselves
+        self.assertEqual(names('name=*%25'), ['Al_50%'])
+
+    def test_search_escapes_like_wildcards(self):
+        self.client.post('/api/addresses', json={'street': '2 Side_St', 'city': 'Rome', 'person_id': self.person_id})
+        streets = [a['street'] for a in self.client.get('/api/addresses?search=_').json['data']]
+        self.assertEqual(streets, ['2 Side_St'])
+
+if __name__ == '__main__':
+    unittest.main()
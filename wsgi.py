@@ -0,0 +1 @@
+from simple_flask_db import app, db  # noqa: F401 (gunicorn serves wsgi:app; gunicorn.conf.py imports db)